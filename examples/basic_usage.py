@@ -7,17 +7,15 @@
 """
 
 from twbank_fx_client import TaiwanBankFXClient
+from twbank_fx_client.exceptions import TaiwanBankFXError
 
 
-def example_current_rate():
+def example_current_rate(client):
     """範例 1: 查詢即時匯率"""
     print("=" * 60)
     print("範例 1: 查詢美金即時匯率")
     print("=" * 60)
 
-    # 建立客戶端
-    client = TaiwanBankFXClient()
-
     # 查詢美金即時匯率
     usd_rate = client.get_current_rate("USD")
 
@@ -30,35 +28,42 @@ def example_current_rate():
     print()
 
 
-def example_multiple_currencies():
+def example_multiple_currencies(client):
     """範例 2: 查詢多種幣別的即時匯率"""
     print("=" * 60)
     print("範例 2: 查詢多種幣別的即時匯率")
     print("=" * 60)
 
-    client = TaiwanBankFXClient()
-
     # 查詢多種幣別
     currencies = ["USD", "EUR", "JPY", "GBP", "AUD"]
 
+    # 所有幣別都在同一個頁面上，一次請求就能取得
+    try:
+        rates = client.get_current_rates()
+    except TaiwanBankFXError as e:
+        print(f"查詢失敗: {e}")
+        print()
+        return
+
+    # 每列的顯示格式只建立一次
+    row = "{currency_name:12} 即期買入: {spot_buy:8} 即期賣出: {spot_sell:8}".format_map
+
     for currency in currencies:
-        try:
-            rate = client.get_current_rate(currency)
-            print(f"{rate['currency_name']:12} 即期買入: {rate['spot_buy']:8} 即期賣出: {rate['spot_sell']:8}")
-        except Exception as e:
-            print(f"{currency} 查詢失敗: {e}")
+        rate = rates.get(currency)
+        if rate is not None:
+            print(row(rate))
+        else:
+            print(f"{currency} 查詢失敗: 找不到 {currency} 的匯率資訊")
 
     print()
 
 
-def example_historical_rates():
+def example_historical_rates(client):
     """範例 3: 查詢歷史匯率"""
     print("=" * 60)
     print("範例 3: 查詢最近六個月的美金歷史匯率")
     print("=" * 60)
 
-    client = TaiwanBankFXClient()
-
     # 查詢最近六個月的美金匯率
     df = client.get_historical_rates("USD", period="l6m")
 
@@ -68,14 +73,12 @@ def example_historical_rates():
     print()
 
 
-def example_monthly_rates():
+def example_monthly_rates(client):
     """範例 4: 查詢特定月份的歷史匯率"""
     print("=" * 60)
     print("範例 4: 查詢 2025 年 1 月的歐元匯率")
     print("=" * 60)
 
-    client = TaiwanBankFXClient()
-
     # 查詢特定月份
     df = client.get_historical_rates("EUR", period="month", date="2025-01")
 
@@ -98,21 +101,18 @@ def example_context_manager():
     print()
 
 
-def example_error_handling():
+def example_error_handling(client):
     """範例 6: 錯誤處理"""
     print("=" * 60)
     print("範例 6: 錯誤處理")
     print("=" * 60)
 
     from twbank_fx_client.exceptions import (
-        TaiwanBankFXError,
         RequestError,
         ParseError,
         InvalidParameterError
     )
 
-    client = TaiwanBankFXClient()
-
     try:
         # 嘗試查詢不存在的幣別
         rate = client.get_current_rate("XXX")
@@ -132,47 +132,37 @@ def example_error_handling():
     print()
 
 
-def example_data_analysis():
+def example_data_analysis(client):
     """範例 7: 資料分析"""
     print("=" * 60)
     print("範例 7: 計算最近六個月美金匯率的統計資訊")
     print("=" * 60)
 
-    client = TaiwanBankFXClient()
-
-    # 取得歷史資料
+    # 取得歷史資料（匯率欄位已是數值型態）
     df = client.get_historical_rates("USD", period="l6m")
+    columns = ['即期買入', '即期賣出']
 
-    # 轉換為數值型態
-    df['即期買入'] = pd.to_numeric(df['即期買入'], errors='coerce')
-    df['即期賣出'] = pd.to_numeric(df['即期賣出'], errors='coerce')
+    # 一次計算所有統計資訊
+    stats = df[columns].agg(['mean', 'max', 'min', 'std'])
 
-    # 計算統計資訊
-    print("即期買入匯率統計:")
-    print(f"  平均值: {df['即期買入'].mean():.4f}")
-    print(f"  最高值: {df['即期買入'].max():.4f}")
-    print(f"  最低值: {df['即期買入'].min():.4f}")
-    print(f"  標準差: {df['即期買入'].std():.4f}")
-    print()
-
-    print("即期賣出匯率統計:")
-    print(f"  平均值: {df['即期賣出'].mean():.4f}")
-    print(f"  最高值: {df['即期賣出'].max():.4f}")
-    print(f"  最低值: {df['即期賣出'].min():.4f}")
-    print(f"  標準差: {df['即期賣出'].std():.4f}")
-    print()
+    for column in columns:
+        print(f"{column}匯率統計:")
+        print(f"  平均值: {stats.loc['mean', column]:.4f}")
+        print(f"  最高值: {stats.loc['max', column]:.4f}")
+        print(f"  最低值: {stats.loc['min', column]:.4f}")
+        print(f"  標準差: {stats.loc['std', column]:.4f}")
+        print()
 
 
 if __name__ == "__main__":
-    import pandas as pd
-
-    # 執行所有範例
-    example_current_rate()
-    example_multiple_currencies()
-    example_historical_rates()
-    example_monthly_rates()
-    example_context_manager()
-    example_error_handling()
-    example_data_analysis()
+    # 所有範例共用同一個客戶端，後續請求可重複使用已建立的 HTTPS 連線
+    with TaiwanBankFXClient() as client:
+        example_current_rate(client)
+        example_multiple_currencies(client)
+        example_historical_rates(client)
+        example_monthly_rates(client)
+        example_context_manager()
+        example_error_handling(client)
+        example_data_analysis(client)
 
     print("所有範例執行完成！")
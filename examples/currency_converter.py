@@ -6,14 +6,55 @@
 這個範例展示如何使用 twbank-fx-client 建立一個簡單的貨幣轉換器。
 """
 
-from twbank_fx_client import TaiwanBankFXClient
+from dataclasses import dataclass
+
+from twbank_fx_client import get_shared_client
+from twbank_fx_client.exceptions import ParseError, TaiwanBankFXError
+
+
+@dataclass
+class ConversionResult:
+    """貨幣轉換結果"""
+
+    __slots__ = ("from_currency", "to_currency", "from_amount", "to_amount",
+                 "rate", "rate_type", "description")
+
+    from_currency: str
+    to_currency: str
+    from_amount: float
+    to_amount: float
+    rate: float
+    rate_type: str
+    description: str
+
+
+@dataclass
+class SpreadResult:
+    """買賣價差計算結果"""
+
+    __slots__ = ("currency", "buy_rate", "sell_rate", "spread",
+                 "spread_percentage", "rate_type")
+
+    currency: str
+    buy_rate: float
+    sell_rate: float
+    spread: float
+    spread_percentage: float
+    rate_type: str
 
 
 class CurrencyConverter:
     """貨幣轉換器"""
 
-    def __init__(self):
-        self.client = TaiwanBankFXClient()
+    def __init__(self, client=None):
+        """
+        初始化轉換器
+
+        Args:
+            client (TaiwanBankFXClient, optional): 使用的客戶端，預設為共用客戶端；
+                客戶端本身會在記憶體中保留即時匯率 cache_ttl 秒，轉換器不另外快取
+        """
+        self.client = client or get_shared_client()
 
     def twd_to_foreign(self, currency, amount, use_cash=False):
         """
@@ -25,7 +66,7 @@ class CurrencyConverter:
             use_cash (bool): 是否使用現金匯率
 
         Returns:
-            dict: 包含轉換結果的字典
+            ConversionResult: 轉換結果
         """
         rate_info = self.client.get_current_rate(currency)
 
@@ -39,15 +80,15 @@ class CurrencyConverter:
 
         foreign_amount = amount / rate
 
-        return {
-            "from_currency": "TWD",
-            "to_currency": currency,
-            "from_amount": amount,
-            "to_amount": foreign_amount,
-            "rate": rate,
-            "rate_type": rate_type,
-            "description": f"銀行買入 {currency}（客戶賣出）"
-        }
+        return ConversionResult(
+            from_currency="TWD",
+            to_currency=currency,
+            from_amount=amount,
+            to_amount=foreign_amount,
+            rate=rate,
+            rate_type=rate_type,
+            description=f"銀行買入 {currency}（客戶賣出）"
+        )
 
     def foreign_to_twd(self, currency, amount, use_cash=False):
         """
@@ -59,7 +100,7 @@ class CurrencyConverter:
             use_cash (bool): 是否使用現金匯率
 
         Returns:
-            dict: 包含轉換結果的字典
+            ConversionResult: 轉換結果
         """
         rate_info = self.client.get_current_rate(currency)
 
@@ -73,15 +114,15 @@ class CurrencyConverter:
 
         twd_amount = amount * rate
 
-        return {
-            "from_currency": currency,
-            "to_currency": "TWD",
-            "from_amount": amount,
-            "to_amount": twd_amount,
-            "rate": rate,
-            "rate_type": rate_type,
-            "description": f"銀行賣出 {currency}（客戶買入）"
-        }
+        return ConversionResult(
+            from_currency=currency,
+            to_currency="TWD",
+            from_amount=amount,
+            to_amount=twd_amount,
+            rate=rate,
+            rate_type=rate_type,
+            description=f"銀行賣出 {currency}（客戶買入）"
+        )
 
     def calculate_spread(self, currency, use_cash=False):
         """
@@ -92,10 +133,43 @@ class CurrencyConverter:
             use_cash (bool): 是否使用現金匯率
 
         Returns:
-            dict: 包含價差資訊的字典
+            SpreadResult: 價差資訊
         """
-        rate_info = self.client.get_current_rate(currency)
+        return self._spread(currency, self.client.get_current_rate(currency), use_cash)
+
+    def calculate_spreads(self, currencies, use_cash=False):
+        """
+        一次計算多種幣別的買賣價差，所有幣別的匯率只查詢一次
 
+        Args:
+            currencies (list): 幣別代碼清單
+            use_cash (bool): 是否使用現金匯率
+
+        Returns:
+            dict: 以幣別代碼為鍵的 SpreadResult；查詢失敗的幣別對應到該次的例外
+        """
+        try:
+            rates = self.client.get_current_rates()
+        except TaiwanBankFXError as e:
+            return {currency: e for currency in currencies}
+
+        results = {}
+        for currency in currencies:
+            rate_info = rates.get(currency.upper())
+            if rate_info is None:
+                results[currency] = ParseError(f"找不到 {currency} 的匯率資訊")
+                continue
+
+            # 部分幣別沒有現金或即期報價（牌告為 '-'），只影響該幣別
+            try:
+                results[currency] = self._spread(currency, rate_info, use_cash)
+            except (ValueError, ZeroDivisionError) as e:
+                results[currency] = ParseError(f"無法計算 {currency} 的價差: {e}")
+        return results
+
+    @staticmethod
+    def _spread(currency, rate_info, use_cash):
+        """由匯率資訊計算價差"""
         if use_cash:
             buy_rate = float(rate_info['cash_buy'])
             sell_rate = float(rate_info['cash_sell'])
@@ -108,14 +182,14 @@ class CurrencyConverter:
         spread = sell_rate - buy_rate
         spread_percentage = (spread / buy_rate) * 100
 
-        return {
-            "currency": currency,
-            "buy_rate": buy_rate,
-            "sell_rate": sell_rate,
-            "spread": spread,
-            "spread_percentage": spread_percentage,
-            "rate_type": rate_type
-        }
+        return SpreadResult(
+            currency=currency,
+            buy_rate=buy_rate,
+            sell_rate=sell_rate,
+            spread=spread,
+            spread_percentage=spread_percentage,
+            rate_type=rate_type
+        )
 
 
 def main():
@@ -131,30 +205,30 @@ def main():
     print("範例 1: 將 10,000 台幣轉換為美金")
     print("-" * 70)
     result = converter.twd_to_foreign("USD", 10000)
-    print(f"台幣金額: NT$ {result['from_amount']:,.2f}")
-    print(f"美金金額: $ {result['to_amount']:.2f}")
-    print(f"使用匯率: {result['rate']:.4f} ({result['rate_type']})")
-    print(f"說明: {result['description']}")
+    print(f"台幣金額: NT$ {result.from_amount:,.2f}")
+    print(f"美金金額: $ {result.to_amount:.2f}")
+    print(f"使用匯率: {result.rate:.4f} ({result.rate_type})")
+    print(f"說明: {result.description}")
     print()
 
     # 範例 2: 美金轉台幣
     print("範例 2: 將 500 美金轉換為台幣")
     print("-" * 70)
     result = converter.foreign_to_twd("USD", 500)
-    print(f"美金金額: $ {result['from_amount']:,.2f}")
-    print(f"台幣金額: NT$ {result['to_amount']:,.2f}")
-    print(f"使用匯率: {result['rate']:.4f} ({result['rate_type']})")
-    print(f"說明: {result['description']}")
+    print(f"美金金額: $ {result.from_amount:,.2f}")
+    print(f"台幣金額: NT$ {result.to_amount:,.2f}")
+    print(f"使用匯率: {result.rate:.4f} ({result.rate_type})")
+    print(f"說明: {result.description}")
     print()
 
     # 範例 3: 使用現金匯率
     print("範例 3: 使用現金匯率將 10,000 台幣轉換為美金")
     print("-" * 70)
     result = converter.twd_to_foreign("USD", 10000, use_cash=True)
-    print(f"台幣金額: NT$ {result['from_amount']:,.2f}")
-    print(f"美金金額: $ {result['to_amount']:.2f}")
-    print(f"使用匯率: {result['rate']:.4f} ({result['rate_type']})")
-    print(f"說明: {result['description']}")
+    print(f"台幣金額: NT$ {result.from_amount:,.2f}")
+    print(f"美金金額: $ {result.to_amount:.2f}")
+    print(f"使用匯率: {result.rate:.4f} ({result.rate_type})")
+    print(f"說明: {result.description}")
     print()
 
     # 範例 4: 計算買賣價差
@@ -162,17 +236,19 @@ def main():
     print("-" * 70)
     currencies = ["USD", "EUR", "JPY", "GBP"]
 
-    for currency in currencies:
-        try:
-            spread = converter.calculate_spread(currency)
-            print(f"{currency} ({spread['rate_type']})")
-            print(f"  買入匯率: {spread['buy_rate']:.4f}")
-            print(f"  賣出匯率: {spread['sell_rate']:.4f}")
-            print(f"  價差: {spread['spread']:.4f} ({spread['spread_percentage']:.2f}%)")
-            print()
-        except Exception as e:
-            print(f"{currency} 查詢失敗: {e}")
+    spreads = converter.calculate_spreads(currencies)
+
+    for currency, spread in spreads.items():
+        if isinstance(spread, Exception):
+            print(f"{currency} 查詢失敗: {spread}")
             print()
+            continue
+
+        print(f"{currency} ({spread.rate_type})")
+        print(f"  買入匯率: {spread.buy_rate:.4f}")
+        print(f"  賣出匯率: {spread.sell_rate:.4f}")
+        print(f"  價差: {spread.spread:.4f} ({spread.spread_percentage:.2f}%)")
+        print()
 
     # 範例 5: 旅遊預算計算
     print("範例 5: 計算日本旅遊預算")
@@ -182,15 +258,15 @@ def main():
 
     # 現金匯率（適合出國旅遊）
     result = converter.twd_to_foreign("JPY", 50000, use_cash=True)
-    print(f"可換日圓: ¥ {result['to_amount']:,.2f}")
-    print(f"使用匯率: {result['rate']:.4f} ({result['rate_type']})")
+    print(f"可換日圓: ¥ {result.to_amount:,.2f}")
+    print(f"使用匯率: {result.rate:.4f} ({result.rate_type})")
     print()
 
     # 計算剩餘日圓換回台幣
     print("假設旅遊結束後剩餘 ¥ 10,000")
     result = converter.foreign_to_twd("JPY", 10000, use_cash=True)
-    print(f"可換回台幣: NT$ {result['to_amount']:,.2f}")
-    print(f"使用匯率: {result['rate']:.4f} ({result['rate_type']})")
+    print(f"可換回台幣: NT$ {result.to_amount:,.2f}")
+    print(f"使用匯率: {result.rate:.4f} ({result.rate_type})")
     print()
 
 
@@ -6,60 +6,84 @@
 這個範例展示如何使用 twbank-fx-client 監控匯率變化。
 """
 
+import asyncio
 import time
 from datetime import datetime
-from twbank_fx_client import TaiwanBankFXClient
+from twbank_fx_client import TaiwanBankFXClient, get_shared_client
+from twbank_fx_client.exceptions import ParseError, RequestError
 
 
 class RateMonitor:
     """匯率監控器"""
 
-    def __init__(self, currency="USD", threshold=0.1):
+    def __init__(self, currency="USD", threshold=0.1, client=None):
         """
         初始化監控器
 
         Args:
             currency (str): 要監控的幣別
             threshold (float): 警示門檻（匯率變化超過此值時發出警示）
+            client (TaiwanBankFXClient, optional): 使用的客戶端，預設為共用客戶端
         """
-        self.client = TaiwanBankFXClient()
+        self.client = client or get_shared_client()
         self.currency = currency
         self.threshold = threshold
         self.last_rate = None
 
     def check_rate(self):
         """檢查目前匯率"""
+        # 客戶端會在記憶體中保留即時匯率 cache_ttl 秒，間隔較短時可能拿到同一筆報價
         rate_info = self.client.get_current_rate(self.currency)
         current_rate = float(rate_info['spot_buy'])
 
+        # 保留 rate_info 的所有欄位（包括實際取得報價的 timestamp），再加上監控相關資訊
         result = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            **rate_info,
             "currency": self.currency,
             "rate": current_rate,
-            "cash_buy": rate_info['cash_buy'],
-            "cash_sell": rate_info['cash_sell'],
-            "spot_buy": rate_info['spot_buy'],
-            "spot_sell": rate_info['spot_sell'],
             "change": None,
             "change_percentage": None,
             "alert": False
         }
 
-        if self.last_rate is not None:
-            change = current_rate - self.last_rate
-            change_percentage = (change / self.last_rate) * 100
-
+        last_rate = self.last_rate
+        if last_rate is not None:
+            change = current_rate - last_rate
             result["change"] = change
-            result["change_percentage"] = change_percentage
+            result["change_percentage"] = (change / last_rate) * 100
 
             # 檢查是否超過門檻
-            if abs(change) >= self.threshold:
-                result["alert"] = True
+            result["alert"] = abs(change) >= self.threshold
 
         self.last_rate = current_rate
 
         return result
 
+    async def check_rate_async(self):
+        """檢查目前匯率（非同步版本，查詢交由執行緒池處理，不會阻塞事件迴圈）"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.check_rate)
+
+    def _print_result(self, result):
+        """顯示單次檢查的結果"""
+        print(f"[{result['timestamp']}] {result['currency']}")
+        print(f"  即期買入: {result['spot_buy']} / 即期賣出: {result['spot_sell']}")
+        print(f"  現金買入: {result['cash_buy']} / 現金賣出: {result['cash_sell']}")
+
+        if result['change'] is not None:
+            change_symbol = "▲" if result['change'] > 0 else "▼"
+            print(f"  變化: {change_symbol} {result['change']:+.4f} ({result['change_percentage']:+.2f}%)")
+
+            if result['alert']:
+                print(f"  ⚠️  警示: 匯率變化超過門檻 {self.threshold}")
+
+        print()
+
+    def _print_skipped(self, error):
+        """顯示略過本次檢查的原因"""
+        print(f"[{datetime.now().isoformat(' ', 'seconds')}] {self.currency} 查詢失敗，略過本次檢查: {error}")
+        print()
+
     def monitor(self, interval=300, duration=3600):
         """
         持續監控匯率
@@ -74,73 +98,127 @@ class RateMonitor:
         print("=" * 80)
         print()
 
-        start_time = time.time()
+        # 使用 monotonic 時鐘，不受系統校時影響
+        deadline = time.monotonic() + duration
+        next_tick = time.monotonic()
 
         try:
             while True:
+                # 檢查匯率；網路暫時中斷時略過本次檢查，繼續監控
+                try:
+                    self._print_result(self.check_rate())
+                except RequestError as e:
+                    self._print_skipped(e)
+
+                # 以絕對時間排程下次檢查，檢查本身的耗時不會累積成誤差
+                next_tick += interval
+                now = time.monotonic()
+                sleep_for = max(0, next_tick - now)
+
                 # 檢查是否超過監控時間
-                elapsed = time.time() - start_time
-                if elapsed >= duration:
+                if now + sleep_for >= deadline:
                     print(f"\n監控時間已達 {duration} 秒，結束監控")
                     break
 
-                # 檢查匯率
-                result = self.check_rate()
+                # 等待下次檢查
+                time.sleep(sleep_for)
 
-                # 顯示資訊
-                print(f"[{result['timestamp']}] {result['currency']}")
-                print(f"  即期買入: {result['spot_buy']} / 即期賣出: {result['spot_sell']}")
-                print(f"  現金買入: {result['cash_buy']} / 現金賣出: {result['cash_sell']}")
+        except KeyboardInterrupt:
+            print("\n監控已中斷")
 
-                if result['change'] is not None:
-                    change_symbol = "▲" if result['change'] > 0 else "▼"
-                    print(f"  變化: {change_symbol} {result['change']:+.4f} ({result['change_percentage']:+.2f}%)")
+    async def _watch(self, interval):
+        """依固定間隔檢查匯率，直到被取消為止"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
 
-                    if result['alert']:
-                        print(f"  ⚠️  警示: 匯率變化超過門檻 {self.threshold}")
+        while True:
+            try:
+                self._print_result(await self.check_rate_async())
+            except RequestError as e:
+                self._print_skipped(e)
 
-                print()
+            next_tick += interval
+            await asyncio.sleep(max(0, next_tick - loop.time()))
 
-                # 等待下次檢查
-                time.sleep(interval)
+    async def monitor_async(self, interval=300, duration=3600):
+        """
+        以非同步方式持續監控匯率
+
+        多個監控器可以在同一個事件迴圈中並行執行，等待期間不佔用執行緒。
+
+        Args:
+            interval (int): 檢查間隔（秒），預設 300 秒（5 分鐘）
+            duration (int): 監控持續時間（秒），預設 3600 秒（1 小時）
+        """
+        print(f"開始監控 {self.currency} 匯率（間隔 {interval} 秒，門檻 {self.threshold}）")
+
+        try:
+            await asyncio.wait_for(self._watch(interval), timeout=duration)
+        except asyncio.TimeoutError:
+            print(f"{self.currency} 監控時間已達 {duration} 秒，結束監控")
 
-        except KeyboardInterrupt:
-            print("\n監控已中斷")
 
+def monitor_currencies(currencies, interval=300, duration=3600, threshold=0.1):
+    """
+    在單一事件迴圈中同時監控多種幣別
+
+    Args:
+        currencies (list): 要監控的幣別代碼清單
+        interval (int): 檢查間隔（秒）
+        duration (int): 監控持續時間（秒）
+        threshold (float): 警示門檻
+    """
+    monitors = [RateMonitor(currency=currency, threshold=threshold) for currency in currencies]
 
-def compare_multiple_currencies():
+    async def run():
+        await asyncio.gather(*(monitor.monitor_async(interval, duration) for monitor in monitors))
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\n監控已中斷")
+
+
+def compare_multiple_currencies(client):
     """比較多種幣別的匯率"""
     print("=" * 80)
     print("多幣別匯率比較")
     print("=" * 80)
     print()
 
-    client = TaiwanBankFXClient()
     currencies = ["USD", "EUR", "JPY", "GBP", "AUD", "HKD", "CNY"]
 
     print(f"{'幣別':<8} {'即期買入':>10} {'即期賣出':>10} {'現金買入':>10} {'現金賣出':>10}")
     print("-" * 80)
 
+    # 每列的顯示格式只建立一次
+    row = "{currency:<8} {spot_buy:>10} {spot_sell:>10} {cash_buy:>10} {cash_sell:>10}".format_map
+
+    # 所有幣別都在同一個頁面上，一次請求取得後依原本順序顯示
+    try:
+        rates = client.get_current_rates()
+    except (RequestError, ParseError) as e:
+        print(f"查詢失敗: {e}")
+        print()
+        return
+
     for currency in currencies:
-        try:
-            rate = client.get_current_rate(currency)
-            print(f"{currency:<8} {rate['spot_buy']:>10} {rate['spot_sell']:>10} "
-                  f"{rate['cash_buy']:>10} {rate['cash_sell']:>10}")
-        except Exception as e:
-            print(f"{currency:<8} 查詢失敗: {e}")
+        rate = rates.get(currency)
+        if rate is not None:
+            print(row(rate))
+        else:
+            print(f"{currency:<8} 查詢失敗")
 
     print()
 
 
-def rate_alert_example():
+def rate_alert_example(client):
     """匯率警示範例"""
     print("=" * 80)
     print("匯率警示範例")
     print("=" * 80)
     print()
 
-    client = TaiwanBankFXClient()
-
     # 設定目標匯率
     target_currency = "USD"
     target_buy_rate = 31.5  # 假設目標買入匯率
@@ -182,11 +260,13 @@ def rate_alert_example():
 
 def main():
     """主程式"""
-    # 範例 1: 比較多種幣別
-    compare_multiple_currencies()
+    # 兩個範例共用同一個客戶端與連線
+    with TaiwanBankFXClient() as client:
+        # 範例 1: 比較多種幣別
+        compare_multiple_currencies(client)
 
-    # 範例 2: 匯率警示
-    rate_alert_example()
+        # 範例 2: 匯率警示
+        rate_alert_example(client)
 
     # 範例 3: 持續監控（註解掉，避免長時間執行）
     # 如果要執行監控，請取消註解以下程式碼
@@ -200,6 +280,9 @@ def main():
 
     # 監控 1 小時，每 5 分鐘檢查一次
     monitor.monitor(interval=300, duration=3600)
+
+    # 或在同一個事件迴圈中同時監控多種幣別
+    monitor_currencies(["USD", "EUR", "JPY"], interval=300, duration=3600, threshold=0.05)
     """
 
     print("範例執行完成！")
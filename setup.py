@@ -33,11 +33,17 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "requests>=2.31.0",
-        "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
         "pandas>=2.0.0",
-        "html5lib>=1.1",
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            # urllib3 可使用任一套件解壓縮 brotli；PyPy 上使用 brotlicffi
+            "brotli>=1.0.9; platform_python_implementation == 'CPython'",
+            "brotlicffi>=0.8.0; platform_python_implementation != 'CPython'",
+        ],
+    },
     entry_points={
         'console_scripts': [
             'twbank-fx=twbank_fx_client.cli:main',
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+歷史匯率表頭合併的測試
+
+以隨機產生的兩層表頭比對 _flatten_header 與最初的逐欄迴圈，確認向量化後的結果完全相同。
+"""
+
+import random
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from twbank_fx_client.client import _flatten_header
+
+
+def _reference_flatten(columns):
+    """最初版本 _process_dataframe_columns 中的逐欄迴圈"""
+    new_columns = []
+    level0 = columns.get_level_values(0)
+    level1 = columns.get_level_values(1)
+    current_level0 = None
+
+    for i, (l0, l1) in enumerate(zip(level0, level1)):
+        l0_str = str(l0).strip()
+        l1_str = str(l1).strip()
+
+        if 'unnamed' in l0_str.lower() or l0_str in ['', 'NaN', 'nan']:
+            if current_level0:
+                l0_str = current_level0
+        else:
+            current_level0 = l0_str
+
+        if 'unnamed' in l1_str.lower() or l1_str in ['', 'NaN', 'nan']:
+            if i == 6:
+                l1_str = '本行買入'
+            elif i in [7, 8]:
+                l1_str = '本行賣出'
+
+        if l0_str and 'unnamed' not in l0_str.lower() and l0_str != 'NaN':
+            if l1_str and 'unnamed' not in l1_str.lower():
+                new_col = f"{l0_str}_{l1_str}"
+            else:
+                new_col = l0_str
+        else:
+            new_col = l1_str if l1_str else f"Column_{i}"
+
+        new_columns.append(new_col)
+
+    return new_columns
+
+
+_LABELS = ['日期', ' 幣別 ', '現金匯率', '即期匯率', '本行買入', 'x', 'Unnamed: 1_level_0',
+           ' UNNAMED x ', '', '  ', 'nan', 'NaN', np.nan, None, 3]
+
+
+class FlattenHeaderTest(unittest.TestCase):
+
+    def assertMatchesReference(self, level0, level1):
+        columns = pd.MultiIndex.from_arrays([level0, level1])
+        self.assertEqual(_flatten_header(columns), _reference_flatten(columns))
+
+    def test_missing_labels_are_kept_in_joined_names(self):
+        columns = pd.MultiIndex.from_arrays([[np.nan, 'X'], ['a', np.nan]])
+        self.assertEqual(_flatten_header(columns), ['nan_a', 'X_nan'])
+
+    def test_positional_buy_sell_labels(self):
+        level0 = ['日期'] + ['現金匯率'] * 8
+        level1 = ['日期', '本行買入', '本行賣出', '本行買入', '本行賣出', 'x', '', 'Unnamed: 7', '']
+        columns = pd.MultiIndex.from_arrays([level0, level1])
+        self.assertEqual(_flatten_header(columns)[6:],
+                         ['現金匯率_本行買入', '現金匯率_本行賣出', '現金匯率_本行賣出'])
+
+    def test_random_headers_match_reference(self):
+        rng = random.Random(1)
+        for _ in range(3000):
+            n = rng.randint(1, 12)
+            self.assertMatchesReference([rng.choice(_LABELS) for _ in range(n)],
+                                        [rng.choice(_LABELS) for _ in range(n)])
+
+
+if __name__ == "__main__":
+    unittest.main()
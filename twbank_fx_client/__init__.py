@@ -9,18 +9,33 @@ twbank-fx-client - 台灣銀行外匯匯率查詢 API 客戶端
 __version__ = "0.1.0"
 __author__ = "Your Name"
 
-from .client import TaiwanBankFXClient
+import logging
+
 from .exceptions import (
     TaiwanBankFXError,
     RequestError,
     ParseError,
     InvalidParameterError
 )
+from .models import FXRate
+
+# 函式庫預設不輸出任何日誌，由使用者自行設定 logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __all__ = [
     "TaiwanBankFXClient",
+    "get_shared_client",
+    "FXRate",
     "TaiwanBankFXError",
     "RequestError",
     "ParseError",
     "InvalidParameterError",
 ]
+
+
+def __getattr__(name):
+    """第一次使用時才載入客戶端模組，匯入套件本身不會載入 requests 與 lxml"""
+    if name in ("TaiwanBankFXClient", "get_shared_client"):
+        from . import client
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
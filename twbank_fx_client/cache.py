@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+客戶端使用的快取：記憶體中的 LRUCache 與歷史匯率的磁碟快取 FileCache
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """
+    只保留最近使用的 maxsize 個項目的記憶體快取
+
+    超過上限時捨棄最久沒有使用的項目，讓長時間執行的客戶端（例如共用客戶端）
+    不會因為查詢過的網址越來越多而持續佔用記憶體。可在多個執行緒間共用。
+
+    Examples:
+        >>> cache = LRUCache(maxsize=32)
+        >>> cache["key"] = "value"
+        >>> cache.get("key")
+        'value'
+    """
+
+    def __init__(self, maxsize):
+        """
+        初始化快取
+
+        Args:
+            maxsize (int): 保留的項目數上限
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        讀取快取，並將項目標記為最近使用
+
+        Args:
+            key: 快取鍵
+            default: 沒有快取時的回傳值，預設為 None
+
+        Returns:
+            快取的值；沒有快取時為 default
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def clear(self):
+        """清除所有項目"""
+        with self._lock:
+            self._data.clear()
+
+
+class FileCache:
+    """
+    以檔案儲存 DataFrame 的快取
+
+    每個項目由兩個 JSON 檔組成：以 orient="table" 儲存的資料，以及到期時間與各欄位的型態，
+    檔名為快取鍵的雜湊值。使用 JSON 而不是 pickle，讀取快取目錄中的檔案不會執行任意程式碼。
+    讀寫失敗時視同沒有快取，不會影響查詢。
+
+    Examples:
+        >>> cache = FileCache("~/.cache/twbank-fx")
+        >>> cache.set("key", df, ttl=3600)
+        >>> df = cache.get("key")
+    """
+
+    def __init__(self, directory):
+        """
+        初始化快取
+
+        Args:
+            directory (str): 快取目錄，不存在時會在第一次寫入時建立
+        """
+        self.directory = os.path.expanduser(directory)
+
+    def get(self, key):
+        """
+        讀取快取
+
+        Args:
+            key (str): 快取鍵
+
+        Returns:
+            pandas.DataFrame: 快取的資料；沒有快取、已過期或檔案損毀時為 None
+        """
+        data_path, meta_path = self._paths(key)
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            expires = meta.get("expires")
+            dtypes = meta.get("dtypes")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("無法讀取快取檔案 %s: %s", meta_path, e)
+            return None
+
+        if expires is not None and time.time() >= expires:
+            return None
+
+        import pandas as pd
+
+        try:
+            df = pd.read_json(data_path, orient="table")
+            # JSON 不保留 datetime 的精度與 Arrow 等擴充型態，依寫入時的型態還原
+            return df.astype(dtypes) if dtypes else df
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # 檔案損毀時視同沒有快取，重新查詢後會覆寫
+            logger.warning("無法讀取快取檔案 %s: %s", data_path, e)
+            return None
+
+    def set(self, key, df, ttl=None):
+        """
+        寫入快取
+
+        Args:
+            key (str): 快取鍵
+            df (pandas.DataFrame): 要快取的資料
+            ttl (float, optional): 有效秒數，預設為 None（永不過期）
+        """
+        data_path, meta_path = self._paths(key)
+        expires = None if ttl is None else time.time() + ttl
+
+        try:
+            data = df.to_json(orient="table", index=False).encode("utf-8")
+            meta = json.dumps({
+                "expires": expires,
+                "dtypes": {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+            }).encode("utf-8")
+        except Exception as e:
+            # 無法以 JSON 表示的型態就不快取
+            logger.warning("無法序列化快取資料 %s: %s", data_path, e)
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # 先寫資料再寫到期時間，讀取端看到到期時間時資料一定已經完整
+            self._write_atomic(data_path, lambda f: f.write(data))
+            self._write_atomic(meta_path, lambda f: f.write(meta))
+        except OSError as e:
+            logger.warning("無法寫入快取檔案 %s: %s", data_path, e)
+
+    def _paths(self, key):
+        """取得快取鍵對應的資料檔與到期時間檔路徑"""
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, name)
+        return base + ".data.json", base + ".json"
+
+    def _write_atomic(self, path, write):
+        """先寫入暫存檔再取代，避免其他執行緒或程序讀到寫到一半的檔案"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
@@ -6,11 +6,26 @@
 
 import argparse
 import json
+import logging
 import sys
 
-from .client import TaiwanBankFXClient
 from .exceptions import TaiwanBankFXError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _write_json(data):
+    """輸出 JSON；有安裝 orjson 時直接將 UTF-8 位元組寫入 stdout，省去字串的重複編碼"""
+    if orjson is None:
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
+
 
 def main():
     """命令列主程式"""
@@ -79,9 +94,24 @@ def main():
         default=10,
         help="請求超時時間（秒），預設為 10 秒"
     )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="在標準錯誤輸出顯示除錯訊息（請求網址、快取使用情形等）"
+    )
 
     args = parser.parse_args()
 
+    # 日誌一律輸出到 stderr，不影響 stdout 的 JSON/CSV 輸出
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s"
+    )
+
+    # 延後匯入客戶端，讓 --help 等不需要查詢的操作不必載入相依套件
+    from .client import TaiwanBankFXClient
+
     try:
         client = TaiwanBankFXClient(timeout=args.timeout)
 
@@ -90,15 +120,15 @@ def main():
             result = client.get_current_rate(currency=args.currency)
 
             if args.output == "json":
-                print(json.dumps(result, ensure_ascii=False, indent=2))
+                _write_json(result.to_dict())
             else:
-                print(f"\n{result['currency_name']} 即時匯率")
+                print(f"\n{result.currency_name} 即時匯率")
                 print("=" * 50)
-                print(f"現金買入: {result['cash_buy']}")
-                print(f"現金賣出: {result['cash_sell']}")
-                print(f"即期買入: {result['spot_buy']}")
-                print(f"即期賣出: {result['spot_sell']}")
-                print(f"查詢時間: {result['timestamp']}")
+                print(f"現金買入: {result.cash_buy}")
+                print(f"現金賣出: {result.cash_sell}")
+                print(f"即期買入: {result.spot_buy}")
+                print(f"即期賣出: {result.spot_sell}")
+                print(f"查詢時間: {result.timestamp}")
 
         elif args.type == "historical":
             # 查詢歷史匯率
@@ -112,10 +142,16 @@ def main():
             if args.limit:
                 result = result.head(args.limit)
 
+            # 日期欄位已是 datetime；輸出時維持原本的 YYYY/MM/DD 格式，不影響解析輸出的程式
+            if "日期" in result.columns and result["日期"].dtype.kind == "M":
+                result = result.assign(**{"日期": result["日期"].dt.strftime("%Y/%m/%d")})
+
+            # 直接寫入 stdout，不先產生完整字串再輸出
             if args.output == "json":
-                print(result.to_json(orient="records", force_ascii=False, indent=2))
+                result.to_json(sys.stdout, orient="records", force_ascii=False, indent=2, date_format="iso")
+                sys.stdout.write("\n")
             elif args.output == "csv":
-                print(result.to_csv(index=False))
+                result.to_csv(sys.stdout, index=False, lineterminator="\n")
             else:
                 print(f"\n{args.currency} 歷史匯率")
                 print("=" * 80)
@@ -4,13 +4,160 @@
 台灣銀行外匯匯率 API 客戶端
 """
 
+import atexit
+import importlib.util
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from lxml import html as lxml_html
+from dataclasses import replace
 from datetime import datetime
-import pandas as pd
 from io import StringIO
 
+from .cache import FileCache, LRUCache
 from .exceptions import RequestError, ParseError, InvalidParameterError
+from .models import FXRate
+
+logger = logging.getLogger(__name__)
+
+# 即時匯率表第一欄中的幣別代碼，例如 '美金 (USD)' 中的 'USD'
+_CURRENCY_CODE_RE = re.compile(r"\(([A-Z]{3})\)")
+
+# 幣別代碼格式（ISO 4217 三碼）
+_CURRENCY_FORMAT_RE = re.compile(r"[A-Za-z]{3}")
+
+# 歷史匯率的查詢期間 -> QUOTE_BASE_URL 之後的路徑
+_HISTORY_PATHS = {
+    'ltm': "ltm/{currency}",
+    'l6m': "l6m/{currency}",
+    'month': "{date}/{currency}",
+    'day': "{date}/{currency}/{rate_type}",
+}
+# 以 tuple 比對，傳入 list 等不可雜湊的值時同樣回報參數錯誤
+_VALID_PERIODS = tuple(_HISTORY_PATHS)
+_VALID_RATE_TYPES = ('spot', 'cash')
+_VALID_DTYPE_BACKENDS = (None, 'numpy_nullable', 'pyarrow')
+
+
+def _table_fragment(html):
+    """
+    擷取頁面中第一個 <table> 到最後一個 </table> 之間的內容
+
+    牌告匯率頁面大部分是頁首、選單與腳本，只把表格交給 lxml 可以少建立許多節點。
+    找不到表格標籤時回傳原本的 html。
+    """
+    start = html.find("<table")
+    end = html.rfind("</table>")
+    if start == -1 or end < start:
+        return html
+    return html[start:end + len("</table>")]
+
+
+def _parse_rate_rows(html, timestamp):
+    """
+    解析即時匯率表格的每一列
+
+    Args:
+        html (str): 牌告匯率頁面或其中的表格片段
+        timestamp (str): 查詢時間
+
+    Returns:
+        dict: 以幣別代碼為鍵的 FXRate；找不到任何資料時為空字典
+    """
+    doc = lxml_html.fromstring(html)
+
+    # 一次取出每一列的前五欄（幣別、現金買入、現金賣出、即期買入、即期賣出），
+    # 依文件順序排列，每五個為一列；排除內含巢狀表格的列，避免欄位順序交錯
+    cells = doc.xpath(
+        "//table//tbody//tr[count(td) >= 5][not(.//tr)]/td[position() <= 5]"
+    )
+    texts = [cell.text_content().strip() for cell in cells]
+
+    rates = {}
+    for i in range(0, len(texts), 5):
+        currency_name, cash_buy, cash_sell, spot_buy, spot_sell = texts[i:i + 5]
+
+        # 第一欄的格式為「美金 (USD)」，以括號中的代碼作為鍵
+        match = _CURRENCY_CODE_RE.search(currency_name)
+        if match is None or match.group(1) in rates:
+            continue
+
+        rates[match.group(1)] = FXRate(
+            currency=match.group(1),
+            currency_name=currency_name,
+            cash_buy=cash_buy,
+            cash_sell=cash_sell,
+            spot_buy=spot_buy,
+            spot_sell=spot_sell,
+            timestamp=timestamp
+        )
+    return rates
+
+
+# 歷史匯率表頭第二層為空白時，依欄位位置補上的名稱
+_POSITIONAL_LEVEL1 = {6: '本行買入', 7: '本行賣出', 8: '本行賣出'}
+
+
+def _header_level(columns, level):
+    """取出 MultiIndex 某一層的表頭文字（與 str() 相同，缺值為 'nan'，並去除前後空白）"""
+    import pandas as pd
+
+    return pd.Series(columns.get_level_values(level), dtype=object).map(str).str.strip()
+
+
+def _placeholder_mask(labels):
+    """判斷每個表頭文字是否為空白或 read_html 自動產生的佔位名稱，例如 'Unnamed: 6_level_1'"""
+    return (labels.eq("") | labels.isin(["NaN", "nan"])
+            | labels.str.contains("unnamed", case=False, regex=False))
+
+
+def _flatten_header(columns):
+    """
+    將兩層的 MultiIndex 表頭合併為單層的欄位名稱
+
+    第一層的空白表頭沿用左側最近的名稱（合併儲存格），第 7~9 欄空白的第二層表頭依位置補上
+    買入/賣出，其餘以「第一層_第二層」命名。判斷是否合併的規則與最初的逐欄迴圈相同：
+    合併時只把空白與 'Unnamed' 視為沒有名稱，缺值轉成的 'nan' 仍會保留在名稱中。
+
+    Args:
+        columns (pandas.MultiIndex): read_html 產生的表頭
+
+    Returns:
+        list: 合併後的欄位名稱
+    """
+    level0 = _header_level(columns, 0)
+    level1 = _header_level(columns, 1)
+
+    # 第一層的空白表頭沿用左側最近的名稱（合併儲存格）
+    level0 = level0.mask(_placeholder_mask(level0)).ffill().fillna(level0)
+
+    # 第 7~9 欄的第二層表頭為空白時，依位置補上買入/賣出
+    fillable = _placeholder_mask(level1) & level1.index.isin(list(_POSITIONAL_LEVEL1))
+    level1 = level1.mask(fillable, level1.index.map(_POSITIONAL_LEVEL1))
+
+    named0 = ~(level0.eq("") | level0.eq("NaN")
+               | level0.str.contains("unnamed", case=False, regex=False))
+    named1 = ~(level1.eq("") | level1.str.contains("unnamed", case=False, regex=False))
+
+    combined = (level0 + "_" + level1).where(named1, level0)
+    fallback = level1.where(level1 != "", "Column_" + level1.index.astype(str))
+    return combined.where(named0, fallback).tolist()
+
+
+def _is_settled(period, date):
+    """判斷查詢的月份或日期是否已經結束（資料不會再變動）"""
+    today = datetime.now()
+    if period == 'month':
+        return date < today.strftime("%Y-%m")
+    if period == 'day':
+        return date < today.strftime("%Y-%m-%d")
+    return False
 
 
 class TaiwanBankFXClient:
@@ -31,19 +178,101 @@ class TaiwanBankFXClient:
 
     BASE_URL = "https://rate.bot.com.tw/xrt"
     QUOTE_BASE_URL = "https://rate.bot.com.tw/xrt/quote"
-
-    def __init__(self, timeout=10):
+    # 回應內容的大小上限（位元組），避免異常的回應耗盡記憶體
+    MAX_RESPONSE_BYTES = 4_000_000
+    # timeout 為單一數值時，建立連線的超時上限（秒）；讀取回應仍使用 timeout
+    CONNECT_TIMEOUT = 3.05
+    # 仍會變動的歷史資料（最近三個月、六個月及當月）在磁碟快取中的有效秒數；
+    # 台灣銀行每個營業日更新，一小時內重複查詢不必重新下載
+    ROLLING_CACHE_TTL = 60 * 60
+    # 條件式請求紀錄與解析結果在記憶體中保留的網址數上限，超過時捨棄最久沒有使用的
+    MAX_CACHED_PAGES = 32
+
+    # (pool_maxsize, max_retries) -> 由 from_shared 建立的共用 session
+    _shared_sessions = {}
+    _shared_sessions_lock = threading.Lock()
+
+    def __init__(self, timeout=10, pool_maxsize=16, cache_dir=None, cache_ttl=60, max_retries=3,
+                 session=None):
         """
         初始化客戶端
 
         Args:
-            timeout (int): 請求超時時間（秒），預設為 10 秒
+            timeout (float, tuple or None): 請求超時時間（秒），預設為 10 秒；
+                傳入單一數值時作為讀取回應的超時，建立連線的超時取它與 CONNECT_TIMEOUT 中較小者。
+                (連線, 讀取) 的 tuple 或 None（不限時）會直接交給 requests
+            pool_maxsize (int): 保留的最大連線數，預設為 16；
+                多執行緒同時查詢時應不小於同時進行的請求數
+            cache_dir (str, optional): 歷史匯率的磁碟快取目錄，例如 '~/.cache/twbank-fx'；
+                預設為 None，不使用磁碟快取。已結束的月份與日期永久快取，
+                最近三個月、六個月及當月的資料快取 ROLLING_CACHE_TTL 秒
+            cache_ttl (float): 即時匯率解析結果在記憶體中的保留時間（秒），預設為 60 秒；
+                設為 0 則每次查詢都重新取得
+            max_retries (int): 連線失敗或伺服器暫時性錯誤（5xx）時的重試次數，預設為 3 次；
+                設為 0 則不重試
+            session (requests.Session, optional): 使用既有的 session，預設為 None 時自行建立；
+                提供 session 時會忽略 pool_maxsize 與 max_retries，close() 也不會關閉它
         """
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        self._file_cache = FileCache(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        # 網址 -> (解析時間, {幣別代碼: 匯率資訊}, 內容)
+        self._rates_cache = {}
+        self._owns_session = session is None
+        self.session = self._create_session(pool_maxsize, max_retries) if session is None else session
+        # 網址 -> (ETag, Last-Modified, 內容)，用於條件式請求
+        self._validators = LRUCache(self.MAX_CACHED_PAGES)
+        # (網址, dtype_backend) -> (內容, 歷史匯率 DataFrame)，伺服器回應 304 時沿用
+        self._parsed_history = LRUCache(self.MAX_CACHED_PAGES)
+
+    @classmethod
+    def from_shared(cls, timeout=10, pool_maxsize=16, cache_dir=None, cache_ttl=60, max_retries=3):
+        """
+        建立使用共用 session 的客戶端
+
+        相同 pool_maxsize 與 max_retries 的客戶端共用同一個 session 與連線池，
+        適合經常建立短暫客戶端的情境（例如每個請求建立一個客戶端的網頁服務），
+        不必每次重新進行 TLS 交握。各客戶端的超時設定與快取仍然各自獨立。
+        共用的 session 在程序結束時自動關閉，客戶端的 close() 不會關閉它。
+
+        Args:
+            參見 __init__
+
+        Returns:
+            TaiwanBankFXClient: 使用共用 session 的客戶端
+
+        Examples:
+            >>> with TaiwanBankFXClient.from_shared() as client:
+            ...     rate = client.get_current_rate("USD")
+        """
+        key = (pool_maxsize, max_retries)
+        with cls._shared_sessions_lock:
+            session = cls._shared_sessions.get(key)
+            if session is None:
+                session = cls._create_session(pool_maxsize, max_retries)
+                cls._shared_sessions[key] = session
+                atexit.register(session.close)
+
+        return cls(timeout=timeout, cache_dir=cache_dir, cache_ttl=cache_ttl, session=session)
+
+    @staticmethod
+    def _create_session(pool_maxsize, max_retries):
+        """建立設定好連線池、重試與標頭的 session"""
+        session = requests.Session()
+        # 所有請求都連到同一個主機，保留連線以重複使用 keep-alive socket；
+        # 伺服器暫時性錯誤時以指數退避重試
+        retries = Retry(total=max_retries, backoff_factor=0.3,
+                        status_forcelist=[500, 502, 503, 504])
+        session.mount("https://", HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retries
+        ))
+        # 不覆寫 Accept-Encoding：requests 的預設值只列出 urllib3 能解壓縮的格式，
+        # 有安裝 brotli 時本身就包含 br
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Language': 'zh-TW,zh;q=0.9',
         })
+        return session
 
     def get_current_rate(self, currency="USD"):
         """
@@ -53,7 +282,7 @@ class TaiwanBankFXClient:
             currency (str): 幣別代碼，如 'USD'、'EUR'、'JPY' 等，預設為 'USD'
 
         Returns:
-            dict: 包含匯率資訊的字典，包含以下欄位：
+            FXRate: 匯率資訊，可用屬性或像 dict 一樣用鍵取值，包含以下欄位：
                 - currency: 幣別代碼
                 - currency_name: 幣別名稱（中文）
                 - cash_buy: 現金買入匯率
@@ -63,69 +292,122 @@ class TaiwanBankFXClient:
                 - timestamp: 查詢時間
 
         Raises:
+            InvalidParameterError: 當 currency 不是字串時
             RequestError: 當請求失敗時
             ParseError: 當解析資料失敗時
 
         Examples:
             >>> client = TaiwanBankFXClient()
             >>> usd_rate = client.get_current_rate("USD")
-            >>> print(f"美金即期買入: {usd_rate['spot_buy']}")
+            >>> print(f"美金即期買入: {usd_rate.spot_buy}")
         """
+        if not isinstance(currency, str):
+            raise InvalidParameterError(f"無效的 currency 參數: {currency!r}，應為幣別代碼字串，如 'USD'")
+
+        rates = self._load_current_rates()
         try:
-            url = f"{self.BASE_URL}?Lang=zh-TW"
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            return rates[currency.upper()]
+        except KeyError:
+            raise ParseError(f"找不到 {currency} 的匯率資訊") from None
+
+    def get_current_rates(self, currencies=None):
+        """
+        查詢多個幣別的即時匯率
+
+        牌告匯率頁面只下載並解析一次，需要多個幣別時比逐一呼叫 get_current_rate 更有效率。
+        解析結果會在記憶體中保留 cache_ttl 秒，期間內的查詢不會重新發送請求。
+
+        Args:
+            currencies (list, optional): 幣別代碼清單，如 ['USD', 'EUR']；
+                預設為 None，回傳頁面上的所有幣別
+
+        Returns:
+            dict: 以幣別代碼為鍵、FXRate 為值的字典；指定 currencies 時依清單順序排列
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            rows = soup.select("table tbody tr")
-
-            # 支援的幣別名稱對照
-            currency_names = {
-                "USD": "美金",
-                "EUR": "歐元",
-                "JPY": "日圓",
-                "GBP": "英鎊",
-                "AUD": "澳幣",
-                "CAD": "加拿大幣",
-                "SGD": "新加坡幣",
-                "CHF": "瑞士法郎",
-                "HKD": "港幣",
-                "CNY": "人民幣",
-                "ZAR": "南非幣",
-                "SEK": "瑞典幣",
-                "NZD": "紐西蘭幣",
-                "THB": "泰幣",
-                "KRW": "韓元",
-            }
-
-            currency_name = currency_names.get(currency.upper(), currency.upper())
-
-            for row in rows:
-                row_text = row.text
-                # 檢查是否包含目標幣別和幣別代碼
-                if currency_name in row_text and f"({currency.upper()})" in row_text:
-                    tds = row.select("td")
-                    if len(tds) >= 5:
-                        return {
-                            "currency": currency.upper(),
-                            "currency_name": tds[0].text.strip(),
-                            "cash_buy": tds[1].text.strip(),
-                            "cash_sell": tds[2].text.strip(),
-                            "spot_buy": tds[3].text.strip(),
-                            "spot_sell": tds[4].text.strip(),
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        }
-
-            raise ParseError(f"找不到 {currency} 的匯率資訊")
+        Raises:
+            InvalidParameterError: 當 currencies 是單一字串，或其中有不是字串的項目時
+            RequestError: 當請求失敗時
+            ParseError: 當解析資料失敗，或找不到指定的幣別時
+
+        Examples:
+            >>> client = TaiwanBankFXClient()
+            >>> rates = client.get_current_rates(["USD", "EUR", "JPY"])
+            >>> for code, rate in rates.items():
+            ...     print(code, rate.spot_buy)
+        """
+        if currencies is not None:
+            # 單一字串也可以迭代，會被當成逐字元的清單，因此明確拒絕
+            if isinstance(currencies, str):
+                raise InvalidParameterError(
+                    f"currencies 應為幣別代碼清單，如 ['{currencies}']，而不是單一字串"
+                )
+            currencies = list(currencies)
+            for currency in currencies:
+                if not isinstance(currency, str):
+                    raise InvalidParameterError(
+                        f"無效的幣別代碼: {currency!r}，應為字串，如 'USD'"
+                    )
+
+        rates = self._load_current_rates()
+
+        # FXRate 不可變，只需要複製外層的字典，呼叫端修改結果不會影響快取內容
+        if currencies is None:
+            return dict(rates)
+
+        result = {}
+        for currency in currencies:
+            code = currency.upper()
+            if code not in rates:
+                raise ParseError(f"找不到 {currency} 的匯率資訊")
+            result[code] = rates[code]
+        return result
+
+    def _load_current_rates(self):
+        """
+        取得所有幣別的即時匯率，快取未過期時直接回傳快取內容
 
+        Returns:
+            dict: 以幣別代碼為鍵的字典（快取本身，呼叫端不應修改）
+
+        Raises:
+            RequestError: 當請求失敗時
+            ParseError: 當解析資料失敗時
+        """
+        url = f"{self.BASE_URL}?Lang=zh-TW"
+        cached = self._rates_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            logger.debug("使用記憶體快取: %s", url)
+            return cached[1]
+
+        try:
+            html = self._fetch(url)
+            timestamp = datetime.now().isoformat(" ", "seconds")
+
+            if cached is not None and cached[2] is html:
+                # 伺服器回應 304，內容與上次相同，只更新查詢時間
+                rates = {code: replace(rate, timestamp=timestamp) for code, rate in cached[1].items()}
+            else:
+                # 只解析表格所在的片段；頁面結構改變而找不到資料時，再解析整個頁面
+                fragment = _table_fragment(html)
+                rates = _parse_rate_rows(fragment, timestamp)
+                if not rates and fragment is not html:
+                    rates = _parse_rate_rows(html, timestamp)
+
+                if not rates:
+                    raise ParseError("未找到任何匯率資料")
+
+            self._rates_cache[url] = (time.monotonic(), rates, html)
+            return rates
+
+        except (RequestError, ParseError):
+            raise
         except requests.RequestException as e:
-            raise RequestError(f"請求失敗: {e}")
+            raise RequestError(f"請求失敗: {e}") from e
         except Exception as e:
-            if isinstance(e, (RequestError, ParseError)):
-                raise
-            raise ParseError(f"解析資料時發生錯誤: {e}")
+            raise ParseError(f"解析資料時發生錯誤: {e}") from e
 
-    def get_historical_rates(self, currency="USD", period="l6m", date=None, rate_type="spot"):
+    def get_historical_rates(self, currency="USD", period="l6m", date=None, rate_type="spot",
+                             dtype_backend=None):
         """
         查詢歷史匯率資料
 
@@ -141,14 +423,17 @@ class TaiwanBankFXClient:
                 - period='day' 時，格式為 'YYYY-MM-DD'
             rate_type (str): 匯率類型，'spot'（即期）或 'cash'（現金），預設為 'spot'
                 僅在 period='day' 時使用
+            dtype_backend (str, optional): DataFrame 使用的資料型態後端，
+                可為 'numpy_nullable' 或 'pyarrow'（需安裝 pyarrow），
+                預設為 None，使用 pandas 的預設型態
 
         Returns:
             pandas.DataFrame: 包含歷史匯率資料的 DataFrame，欄位包括：
-                - 日期: 日期
-                - 現金買入: 現金買入匯率
-                - 現金賣出: 現金賣出匯率
-                - 即期買入: 即期買入匯率
-                - 即期賣出: 即期賣出匯率
+                - 日期: 日期（datetime）
+                - 現金買入: 現金買入匯率（數值，無報價時為 NaN）
+                - 現金賣出: 現金賣出匯率（數值，無報價時為 NaN）
+                - 即期買入: 即期買入匯率（數值，無報價時為 NaN）
+                - 即期賣出: 即期賣出匯率（數值，無報價時為 NaN）
 
         Raises:
             InvalidParameterError: 當參數無效時
@@ -164,51 +449,251 @@ class TaiwanBankFXClient:
             >>> # 查詢特定月份的歐元匯率
             >>> df = client.get_historical_rates("EUR", period="month", date="2025-01")
             >>> print(df)
+            >>>
+            >>> # 使用 Arrow 型態的欄位
+            >>> df = client.get_historical_rates("USD", period="l6m", dtype_backend="pyarrow")
         """
         try:
-            # 驗證參數
-            if period in ['month', 'day'] and not date:
+            # 驗證參數，在發送請求前就回報錯誤
+            if period not in _VALID_PERIODS:
+                raise InvalidParameterError(
+                    f"無效的 period 參數: {period}，可選值為 'ltm', 'l6m', 'month', 'day'"
+                )
+            if period in ('month', 'day') and not date:
                 raise InvalidParameterError(
                     f"period='{period}' 時必須提供 date 參數"
                 )
-
-            # 組合 URL
-            if period in ['ltm', 'l6m']:
-                url = f"{self.QUOTE_BASE_URL}/{period}/{currency}"
-            elif period == 'month':
-                url = f"{self.QUOTE_BASE_URL}/{date}/{currency}"
-            elif period == 'day':
-                url = f"{self.QUOTE_BASE_URL}/{date}/{currency}/{rate_type}"
-            else:
+            if not isinstance(currency, str) or not _CURRENCY_FORMAT_RE.fullmatch(currency):
                 raise InvalidParameterError(
-                    f"無效的 period 參數: {period}，可選值為 'ltm', 'l6m', 'month', 'day'"
+                    f"無效的 currency 參數: {currency}，應為三碼幣別代碼，如 'USD'"
                 )
+            if rate_type not in _VALID_RATE_TYPES:
+                raise InvalidParameterError(
+                    f"無效的 rate_type 參數: {rate_type}，可選值為 'spot', 'cash'"
+                )
+            if dtype_backend not in _VALID_DTYPE_BACKENDS:
+                raise InvalidParameterError(
+                    f"無效的 dtype_backend 參數: {dtype_backend}，可選值為 'numpy_nullable', 'pyarrow'"
+                )
+            if dtype_backend == 'pyarrow' and importlib.util.find_spec('pyarrow') is None:
+                raise InvalidParameterError("dtype_backend='pyarrow' 需要安裝 pyarrow")
 
-            # 發送請求
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            # 解析表格
-            tables = pd.read_html(StringIO(response.text))
+            # 組合 URL
+            path = _HISTORY_PATHS[period].format(currency=currency, date=date, rate_type=rate_type)
+            url = f"{self.QUOTE_BASE_URL}/{path}"
+
+            # 磁碟快取；回傳型態會隨 dtype_backend 不同，因此一併納入快取鍵
+            cache_key = None
+            cache_ttl = self._historical_cache_ttl(period, date)
+            if self._file_cache is not None and cache_ttl != 0:
+                cache_key = f"{url}|{dtype_backend}"
+                df = self._file_cache.get(cache_key)
+                if df is not None:
+                    logger.debug("使用磁碟快取: %s", url)
+                    return df
 
-            if not tables:
-                raise ParseError("未找到任何表格資料")
+            # 發送請求
+            html = self._fetch(url)
 
-            df = tables[0]
+            # 伺服器回應 304 時 html 與上次是同一個物件，直接沿用上次的解析結果
+            parsed = self._parsed_history.get((url, dtype_backend))
+            if parsed is not None and parsed[0] is html:
+                logger.debug("沿用先前的解析結果: %s", url)
+                df = parsed[1].copy()
+            else:
+                df = self._parse_historical(html, period, dtype_backend)
+                if url in self._validators:
+                    # 保留一份複本，呼叫端修改回傳值不會影響之後的結果
+                    self._parsed_history[(url, dtype_backend)] = (html, df.copy())
 
-            # 處理欄位名稱
-            df = self._process_dataframe_columns(df, period)
+            if cache_key is not None:
+                self._file_cache.set(cache_key, df, ttl=cache_ttl)
 
             return df
 
+        except (InvalidParameterError, RequestError, ParseError):
+            raise
         except ValueError as e:
-            raise InvalidParameterError(f"參數錯誤: {e}")
+            raise InvalidParameterError(f"參數錯誤: {e}") from e
         except requests.RequestException as e:
-            raise RequestError(f"請求失敗: {e}")
+            raise RequestError(f"請求失敗: {e}") from e
         except Exception as e:
-            if isinstance(e, (InvalidParameterError, RequestError, ParseError)):
-                raise
-            raise ParseError(f"解析資料時發生錯誤: {e}")
+            raise ParseError(f"解析資料時發生錯誤: {e}") from e
+
+    def _parse_historical(self, html, period, dtype_backend=None):
+        """
+        將歷史匯率頁面解析為 DataFrame
+
+        Args:
+            html (str): 網頁內容
+            period (str): 查詢期間類型
+            dtype_backend (str, optional): DataFrame 使用的資料型態後端
+
+        Returns:
+            pandas.DataFrame: 處理欄位名稱並轉換型態後的 DataFrame
+
+        Raises:
+            ParseError: 當找不到表格時
+        """
+        # pandas 載入較慢，只在需要歷史匯率時才匯入
+        import pandas as pd
+
+        # 解析表格；固定使用 lxml，避免退回速度慢且耗記憶體的 bs4 + html5lib，
+        # 並且只把表格所在的片段交給 read_html
+        read_kwargs = {}
+        if dtype_backend is not None:
+            read_kwargs["dtype_backend"] = dtype_backend
+        tables = pd.read_html(StringIO(_table_fragment(html)), flavor="lxml", **read_kwargs)
+
+        if not tables:
+            raise ParseError("未找到任何表格資料")
+
+        df = tables[0]
+
+        # 處理欄位名稱
+        df = self._process_dataframe_columns(df, period)
+
+        # 轉換欄位型態
+        return self._convert_column_types(df, period, dtype_backend)
+
+    def get_historical_rates_batch(self, currency, months, max_workers=8, dtype_backend=None):
+        """
+        一次查詢多個月份的歷史匯率
+
+        各月份的查詢會同時進行，結果依 months 的順序合併為單一 DataFrame。
+
+        Args:
+            currency (str): 幣別代碼，如 'USD'、'EUR' 等
+            months (list): 月份清單，每個元素格式為 'YYYY-MM'
+            max_workers (int): 同時進行的請求數上限，預設為 8
+            dtype_backend (str, optional): DataFrame 使用的資料型態後端，
+                參見 get_historical_rates
+
+        Returns:
+            pandas.DataFrame: 合併後的歷史匯率資料，欄位與 period='month' 的查詢相同
+
+        Raises:
+            InvalidParameterError: 當參數無效時
+            RequestError: 當任一月份的請求失敗時
+            ParseError: 當任一月份的資料解析失敗時
+
+        Examples:
+            >>> client = TaiwanBankFXClient()
+            >>> df = client.get_historical_rates_batch("USD", ["2025-01", "2025-02", "2025-03"])
+            >>> print(df)
+        """
+        if not months:
+            raise InvalidParameterError("months 至少需要包含一個月份")
+
+        def fetch(month):
+            return self.get_historical_rates(
+                currency, period="month", date=month, dtype_backend=dtype_backend
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(months))) as executor:
+            frames = list(executor.map(fetch, months))
+
+        import pandas as pd
+        return pd.concat(frames, ignore_index=True)
+
+    def _convert_column_types(self, df, period, dtype_backend=None):
+        """
+        將歷史匯率的日期與匯率欄位轉為對應的型態
+
+        Args:
+            df (pandas.DataFrame): 已處理欄位名稱的 DataFrame
+            period (str): 查詢期間類型
+            dtype_backend (str, optional): DataFrame 使用的資料型態後端
+
+        Returns:
+            pandas.DataFrame: 轉換後的 DataFrame
+        """
+        if period not in ['ltm', 'l6m', 'month']:
+            return df
+
+        import pandas as pd
+
+        numeric_kwargs = {}
+        if dtype_backend is not None:
+            numeric_kwargs["dtype_backend"] = dtype_backend
+
+        # 一次以向量化方式轉換，無報價的 '-' 會成為 NaN
+        for col in ("現金買入", "現金賣出", "即期買入", "即期賣出"):
+            df[col] = pd.to_numeric(df[col], errors="coerce", **numeric_kwargs)
+        df["日期"] = pd.to_datetime(df["日期"], errors="coerce", format="%Y/%m/%d")
+
+        return df
+
+    def _historical_cache_ttl(self, period, date):
+        """
+        決定歷史匯率查詢在磁碟快取中的有效秒數
+
+        Returns:
+            float: 有效秒數；None 表示永不過期，0 表示不快取
+        """
+        if _is_settled(period, date):
+            # 已結束的月份或日期資料不會再變動
+            return None
+        if period in ('ltm', 'l6m'):
+            return self.ROLLING_CACHE_TTL
+        if period == 'month' and date == datetime.now().strftime("%Y-%m"):
+            return self.ROLLING_CACHE_TTL
+        # 當日的報價在營業時間內持續更新，未來的日期沒有資料
+        return 0
+
+    def _fetch(self, url):
+        """
+        取得網頁內容
+
+        若先前已取得過同一個網址，會帶上 ETag / Last-Modified 發送條件式請求，
+        伺服器回應 304 Not Modified 時直接沿用先前的內容。
+
+        Args:
+            url (str): 網址
+
+        Returns:
+            str: 網頁內容
+
+        Raises:
+            RequestError: 當回應內容超過 MAX_RESPONSE_BYTES 時
+            requests.RequestException: 當請求失敗時
+        """
+        cached = self._validators.get(url)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        timeout = self.timeout
+        if isinstance(timeout, (int, float)):
+            timeout = (min(self.CONNECT_TIMEOUT, timeout), timeout)
+        logger.debug("GET %s", url)
+        with self.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code == 304 and cached is not None:
+                logger.debug("內容未變更，沿用先前的回應: %s", url)
+                return cached[2]
+            response.raise_for_status()
+
+            # 邊讀取邊檢查大小，超過上限就停止，不把整個回應載入記憶體
+            buf = bytearray()
+            for chunk in response.iter_content(65536):
+                buf.extend(chunk)
+                if len(buf) > self.MAX_RESPONSE_BYTES:
+                    raise RequestError(
+                        f"回應內容超過 {self.MAX_RESPONSE_BYTES} 位元組上限: {url}"
+                    )
+
+            html = buf.decode(response.encoding or "utf-8", errors="replace")
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[url] = (etag, last_modified, html)
+
+        return html
 
     def _process_dataframe_columns(self, df, period):
         """
@@ -221,83 +706,90 @@ class TaiwanBankFXClient:
         Returns:
             pandas.DataFrame: 處理後的 DataFrame
         """
-        # 處理 MultiIndex 欄位
+        if period == 'day':
+            # 單日查詢只依位置取前兩欄，不需要整理表頭；只替換欄位名稱，
+            # 不會修改資料，因此不需要先複製
+            if len(df.columns) >= 2:
+                df = df.iloc[:, :2]
+            df.columns = ["類型", "匯率"]
+            return df
+
+        import pandas as pd
+
+        # 處理 MultiIndex 欄位（整理後的名稱用來辨識幣別欄位）
         if isinstance(df.columns, pd.MultiIndex):
             if df.columns.nlevels >= 2:
-                new_columns = []
-                level0 = df.columns.get_level_values(0)
-                level1 = df.columns.get_level_values(1)
-                current_level0 = None
-
-                for i, (l0, l1) in enumerate(zip(level0, level1)):
-                    l0_str = str(l0).strip()
-                    l1_str = str(l1).strip()
-
-                    if 'unnamed' in l0_str.lower() or l0_str in ['', 'NaN', 'nan']:
-                        if current_level0:
-                            l0_str = current_level0
-                    else:
-                        current_level0 = l0_str
-
-                    if 'unnamed' in l1_str.lower() or l1_str in ['', 'NaN', 'nan']:
-                        if i == 6:
-                            l1_str = '本行買入'
-                        elif i in [7, 8]:
-                            l1_str = '本行賣出'
-
-                    if l0_str and 'unnamed' not in l0_str.lower() and l0_str != 'NaN':
-                        if l1_str and 'unnamed' not in l1_str.lower():
-                            new_col = f"{l0_str}_{l1_str}"
-                        else:
-                            new_col = l0_str
-                    else:
-                        new_col = l1_str if l1_str else f"Column_{i}"
-
-                    new_columns.append(new_col)
-
-                df.columns = new_columns
+                df.columns = _flatten_header(df.columns)
             else:
                 df.columns = ['_'.join(col).strip() if isinstance(col, tuple) else str(col)
                              for col in df.columns.values]
 
         # 根據查詢類型處理欄位
         if period in ['ltm', 'l6m', 'month']:
-            # 找出日期欄位
-            date_col_idx = 0
-            for idx, col in enumerate(df.columns):
-                if '日期' in str(col) or '掛牌' in str(col):
-                    date_col_idx = idx
-                    break
-
-            # 找出幣別欄位
-            currency_col_idx = None
-            for idx, col in enumerate(df.columns):
-                if '幣別' in str(col):
-                    currency_col_idx = idx
-                    break
+            # 找出幣別欄位（日期固定在第一欄），以向量化的字串比對取代逐欄檢查
+            is_currency_col = df.columns.astype(str).str.contains('幣別', regex=False)
+            currency_col_idx = is_currency_col.argmax() if is_currency_col.any() else None
 
             # 根據欄位位置選取資料
+            indices = None
             if currency_col_idx == 2 and len(df.columns) >= 6:
                 # 格式：日期、本行買入、幣別、本行賣出、本行買入、本行賣出
-                df = df.iloc[:, [0, 2, 3, 4, 5]].copy()
+                indices = [0, 2, 3, 4, 5]
             elif len(df.columns) >= 5:
                 # 格式：日期、現金買入、現金賣出、即期買入、即期賣出
-                df = df.iloc[:, [0, 1, 2, 3, 4]].copy()
+                indices = [0, 1, 2, 3, 4]
 
-            df.columns = ["日期", "現金買入", "現金賣出", "即期買入", "即期賣出"]
+            # take 本身就會產生獨立的 DataFrame，不需要再 copy 一次，
+            # 之後轉換欄位型態時也不會觸發 SettingWithCopyWarning
+            if indices is not None:
+                df = df.take(indices, axis=1)
 
-        elif period == 'day':
-            # 單日查詢
-            if len(df.columns) >= 2:
-                df = df.iloc[:, :2].copy()
-            df.columns = ["類型", "匯率"]
+            df.columns = ["日期", "現金買入", "現金賣出", "即期買入", "即期賣出"]
 
         return df
 
+    def clear_cache(self):
+        """清除記憶體中的即時匯率快取與條件式請求的紀錄（不影響磁碟快取）"""
+        self._rates_cache.clear()
+        self._parsed_history.clear()
+        self._validators.clear()
+
+    def close(self):
+        """關閉 session 及其保留的連線；外部提供或共用的 session 不會被關閉"""
+        if self._owns_session:
+            self.session.close()
+
     def __enter__(self):
         """支援 context manager"""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """關閉 session"""
-        self.session.close()
+        self.close()
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client():
+    """
+    取得整個程序共用的客戶端
+
+    第一次呼叫時建立，之後都回傳同一個實例，讓不同的模組共用同一個連線池。
+    程序結束時會自動關閉，呼叫端不需要（也不應該）自行關閉。
+
+    Returns:
+        TaiwanBankFXClient: 共用的客戶端
+
+    Examples:
+        >>> client = get_shared_client()
+        >>> rate = client.get_current_rate("USD")
+    """
+    global _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = TaiwanBankFXClient()
+            atexit.register(_shared_client.close)
+        return _shared_client
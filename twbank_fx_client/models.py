@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+資料模型定義
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, eq=False)
+class FXRate(Mapping):
+    """
+    單一幣別的即時匯率
+
+    不可變的物件，可以用屬性（rate.spot_buy）或像 dict 一樣用鍵（rate['spot_buy']）取值，
+    也可以傳給 dict() 或以 ** 展開。需要真正的 dict 時（例如 json.dumps）請使用 to_dict()。
+
+    Examples:
+        >>> rate = client.get_current_rate("USD")
+        >>> rate.spot_buy
+        '31.635'
+        >>> rate['spot_buy']
+        '31.635'
+    """
+
+    __slots__ = ("currency", "currency_name", "cash_buy", "cash_sell",
+                 "spot_buy", "spot_sell", "timestamp")
+
+    currency: str
+    currency_name: str
+    cash_buy: str
+    cash_sell: str
+    spot_buy: str
+    spot_sell: str
+    timestamp: str
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __reduce__(self):
+        # frozen 會擋下 pickle 預設的逐一設定屬性，改用建構子重建
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_dict(self):
+        """
+        轉換為 dict
+
+        Returns:
+            dict: 欄位名稱與值的字典
+        """
+        return {name: getattr(self, name) for name in self.__slots__}